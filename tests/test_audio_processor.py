@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import speech_recognition as sr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from truth_weaver import AudioProcessor, SAMPLE_RATE, SAMPLE_WIDTH, MAX_CHUNK_MS
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds))
+    return (np.sin(t * 0.1) * 8000).astype(np.int16)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.int16)
+
+
+def _audio(*parts: np.ndarray) -> sr.AudioData:
+    return sr.AudioData(np.concatenate(parts).tobytes(), SAMPLE_RATE, SAMPLE_WIDTH)
+
+
+def _pcm(seconds: float) -> sr.AudioData:
+    """Tone of the given length as 16-bit mono PCM"""
+    return _audio(_tone(seconds))
+
+
+def _ms(chunk: sr.AudioData) -> float:
+    return len(chunk.frame_data) * 1000 / (SAMPLE_RATE * SAMPLE_WIDTH)
+
+
+def _stub_processor():
+    processor = AudioProcessor()
+    calls = []
+    
+    def recognize(audio_data):
+        calls.append(len(audio_data.frame_data))
+        return "words", 0.5, True
+    
+    processor._recognize = recognize
+    return processor, calls
+
+
+def test_short_audio_is_recognized_whole():
+    processor, calls = _stub_processor()
+    audio_data = _pcm(5)
+    
+    assert processor._recognize_chunked(audio_data) == ("words", 0.5, True)
+    assert calls == [len(audio_data.frame_data)]
+
+
+def test_long_audio_is_split_into_bounded_chunks():
+    processor, calls = _stub_processor()
+    audio_data = _pcm(75)
+    
+    transcript, confidence, google_ok = processor._recognize_chunked(audio_data)
+    
+    assert len(calls) == 3
+    assert max(calls) <= MAX_CHUNK_MS * SAMPLE_RATE * SAMPLE_WIDTH // 1000
+    assert sum(calls) == len(audio_data.frame_data)
+    assert transcript == "words words words"
+    assert confidence == 0.5
+    assert google_ok
+
+
+def test_long_audio_is_cut_inside_silence():
+    # 20 s of speech, a 2 s pause, then 20 s more: too long for one chunk
+    audio_data = _audio(_tone(20), _silence(2), _tone(20))
+    
+    chunks = AudioProcessor()._split_on_silence(audio_data)
+    
+    assert len(chunks) == 2
+    assert 20000 < _ms(chunks[0]) < 22000
+    assert sum(len(chunk.frame_data) for chunk in chunks) == len(audio_data.frame_data)
+
+
+def test_google_failure_on_any_chunk_is_reported():
+    processor = AudioProcessor()
+    results = iter([("words", 0.9, True), ("sphinx words", 0.3, False), ("words", 0.9, True)])
+    processor._recognize = lambda audio_data: next(results)
+    
+    *_, google_ok = processor._recognize_chunked(_pcm(75))
+    
+    assert not google_ok
+
+
+def test_enhancement_failure_logs_ffmpeg_stderr(monkeypatch, caplog):
+    def run(args, **kwargs):
+        assert "-nostdin" in args
+        raise subprocess.CalledProcessError(1, args, output=b"", stderr=b"input.mp3: Invalid data found")
+    
+    monkeypatch.setattr(subprocess, "run", run)
+    
+    assert AudioProcessor().enhance_audio_data("input.mp3") is None
+    assert "Invalid data found" in caplog.text
@@ -0,0 +1,73 @@
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import truth_weaver
+from truth_weaver import AudioProcessor
+
+
+@pytest.fixture
+def audio_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(truth_weaver, "CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "session1.mp3"
+    path.write_bytes(b"not really audio")
+    return str(path)
+
+
+def _stub_transcriber(monkeypatch, result):
+    calls = []
+    
+    def transcribe_uncached(self, audio_path):
+        calls.append(audio_path)
+        return result
+    
+    monkeypatch.setattr(AudioProcessor, "_transcribe_uncached", transcribe_uncached)
+    return calls
+
+
+def test_cache_hit_skips_transcription(audio_file, monkeypatch):
+    calls = _stub_transcriber(monkeypatch, ("six years of python", 0.9, True))
+    
+    assert AudioProcessor().transcribe_audio(audio_file) == ("six years of python", 0.9)
+    assert AudioProcessor().transcribe_audio(audio_file) == ("six years of python", 0.9)
+    assert len(calls) == 1
+
+
+def test_cache_version_change_misses(audio_file, monkeypatch):
+    calls = _stub_transcriber(monkeypatch, ("six years of python", 0.9, True))
+    
+    AudioProcessor().transcribe_audio(audio_file)
+    monkeypatch.setattr(truth_weaver, "CACHE_VERSION", truth_weaver.CACHE_VERSION + 1)
+    AudioProcessor().transcribe_audio(audio_file)
+    
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("result", [
+    ("", 0.0, False),                   # transcription failed
+    ("six ears of python", 0.3, False)  # Sphinx fallback after a Google failure
+])
+def test_failures_and_fallbacks_are_not_cached(audio_file, monkeypatch, result):
+    calls = _stub_transcriber(monkeypatch, result)
+    
+    AudioProcessor().transcribe_audio(audio_file)
+    AudioProcessor().transcribe_audio(audio_file)
+    
+    assert len(calls) == 2
+    assert not truth_weaver.CACHE_DIR.exists() or not any(truth_weaver.CACHE_DIR.iterdir())
+
+
+def test_failed_cache_write_leaves_no_temp_file(audio_file, monkeypatch):
+    _stub_transcriber(monkeypatch, ("six years of python", 0.9, True))
+    
+    def dump(obj, f):
+        raise pickle.PicklingError("disk full")
+    
+    monkeypatch.setattr(pickle, "dump", dump)
+    
+    assert AudioProcessor().transcribe_audio(audio_file) == ("six years of python", 0.9)
+    assert list(truth_weaver.CACHE_DIR.iterdir()) == []
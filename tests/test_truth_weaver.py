@@ -0,0 +1,79 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import truth_weaver
+from truth_weaver import TruthWeaver, similarity
+
+
+def test_workers_use_configured_recognizer_settings(monkeypatch):
+    def transcribe_audio(self, audio_path):
+        return f"{audio_path}:{self.recognizer.pause_threshold}", 0.9
+    
+    monkeypatch.setattr(truth_weaver.AudioProcessor, "transcribe_audio", transcribe_audio)
+    
+    weaver = TruthWeaver(use_processes=False)
+    weaver.audio_processor.recognizer.pause_threshold = 1.5
+    
+    assert weaver._transcribe_sessions(["a", "b"]) == [("a:1.5", 0.9), ("b:1.5", 0.9)]
+
+
+def test_similarity_identical_transcripts_short_circuit(monkeypatch):
+    def ratio(a, b):
+        raise AssertionError("identical transcripts should not be diffed")
+    
+    monkeypatch.setattr(truth_weaver.fuzz, "ratio", ratio)
+    
+    assert similarity("six years of python", "six years of python") == 1.0
+
+
+def test_similarity_of_different_transcripts():
+    # Indel ratio: 1 - (6 + 7 - 2 * len("ittn")) / (6 + 7)
+    assert similarity("kitten", "sitting") == pytest.approx(8 / 13)
+    assert similarity("abc", "xyz") == 0.0
+
+
+@pytest.fixture
+def fake_whisper(monkeypatch):
+    """Stand-ins for faster_whisper/ctranslate2 that record the model arguments"""
+    model_kwargs = {}
+    
+    faster_whisper = types.ModuleType("faster_whisper")
+    faster_whisper.WhisperModel = lambda model_size, **kwargs: model_kwargs.update(model_size=model_size, **kwargs)
+    faster_whisper.BatchedInferencePipeline = lambda model: None
+    ctranslate2 = types.ModuleType("ctranslate2")
+    ctranslate2.get_cuda_device_count = lambda: 0
+    
+    monkeypatch.setitem(sys.modules, "faster_whisper", faster_whisper)
+    monkeypatch.setitem(sys.modules, "ctranslate2", ctranslate2)
+    return model_kwargs
+
+
+def test_whisper_options_reach_the_model(fake_whisper):
+    TruthWeaver(asr_backend="whisper", whisper_options={"model_size": "medium.en", "compute_type": "float32"})
+    
+    assert fake_whisper == {"model_size": "medium.en", "device": "cpu", "compute_type": "float32"}
+
+
+def test_whisper_defaults_to_int8(fake_whisper):
+    TruthWeaver(asr_backend="whisper")
+    
+    assert fake_whisper["compute_type"] == "int8"
+
+
+def test_whisper_pcm_loading_needs_no_recognizer(fake_whisper, monkeypatch):
+    def no_processor():
+        raise AssertionError("Whisper path should not build an AudioProcessor")
+    
+    monkeypatch.setattr(truth_weaver, "AudioProcessor", no_processor)
+    monkeypatch.setattr(truth_weaver, "_decode_enhanced_pcm", lambda path: b"\x00\x40" * 4)
+    
+    samples = truth_weaver.WhisperBatcher()._load_pcm("session1.mp3")
+    
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [0.5] * 4
@@ -13,20 +13,126 @@ This solution addresses "The Whispering Shadows Mystery" challenge by:
 import json
 import re
 import os
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+import subprocess
+import hashlib
+import pickle
+import tempfile
+import functools
+from collections import Counter
+from typing import Dict, List, Tuple, Any, Optional
+from dataclasses import dataclass, field
 from pathlib import Path
+import numpy as np
+import orjson
 import speech_recognition as sr
 from pydub import AudioSegment
-from pydub.effects import normalize, compress_dynamic_range
+from pydub.silence import detect_nonsilent
+import ahocorasick
+from rapidfuzz import fuzz
 import openai
-from difflib import SequenceMatcher
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ffmpeg filter chain applied by AudioProcessor.enhance_audio
+ENHANCE_FILTERGRAPH = "highpass=f=80,lowpass=f=8000,acompressor=threshold=-20dB:ratio=4,dynaudnorm"
+
+# Raw PCM format handed to the recognizers (16-bit mono at 16 kHz)
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+
+# Long recordings are split at silences into chunks of at most this length
+# and the chunks are recognized concurrently
+MAX_CHUNK_MS = 30000
+CHUNK_WORKERS = 4
+
+# Seconds before an online recognizer request is abandoned, so one stalled
+# Google call cannot hang the chunk and session pools
+RECOGNIZER_TIMEOUT = 30
+
+_NUM_RE = re.compile(r'\d+')
+
+# Disk cache for per-file results, keyed on audio content hash and the
+# pipeline settings; bump CACHE_VERSION whenever a change alters results
+CACHE_DIR = Path(os.environ.get("TRUTHWEAVER_CACHE_DIR", Path.home() / ".cache" / "truthweaver"))
+CACHE_VERSION = 1
+
+# Ordinal encoding of DeceptionAnalyzer confidence levels
+CONFIDENCE_RANKS = {'low': 0, 'medium': 1, 'high': 2}
+
+def similarity(a: str, b: str) -> float:
+    """Indel (LCS-based) similarity ratio in [0, 1] between two transcripts"""
+    # Identical sessions are common, so skip the edit-distance computation
+    if a == b:
+        return 1.0
+    return fuzz.ratio(a, b) / 100.0
+
+def _cache_digest(path: str) -> str:
+    """SHA-256 hex digest of the cache version, pipeline settings and a file's contents"""
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}|{ENHANCE_FILTERGRAPH}|{SAMPLE_RATE}|{MAX_CHUNK_MS}|".encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _transcript_cache_path(audio_path: str) -> Path:
+    """Cache file for an audio file's transcript"""
+    return CACHE_DIR / f"{_cache_digest(audio_path)}.pkl"
+
+def _load_cached_transcript(cache_path: Path) -> Optional[Tuple[str, float]]:
+    """Return a cached (transcript, confidence), or None on a miss or unreadable entry"""
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def _store_cached_transcript(cache_path: Path, result: Tuple[str, float]):
+    """Write a transcript to the cache atomically, since worker processes share it"""
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as f:
+            tmp_path = f.name
+            pickle.dump(result, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning("Could not write cache %s: %s", cache_path, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+def _run_enhance_filtergraph(audio_path: str, output_args: List[str]) -> bytes:
+    """Run ENHANCE_FILTERGRAPH over a file with ffmpeg and return its stdout"""
+    # All enhancements happen in a single ffmpeg filtergraph pass:
+    # high-pass to cut low-frequency noise, low-pass to cut
+    # high-frequency noise, compression to lift quiet parts,
+    # then volume normalization
+    # -nostdin keeps concurrent ffmpeg runs from reading the terminal
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+                "-i", audio_path, "-af", ENHANCE_FILTERGRAPH, *output_args
+            ],
+            check=True,
+            capture_output=True
+        )
+    except subprocess.CalledProcessError as e:
+        # Surface ffmpeg's own error message in the logged failure
+        stderr = e.stderr.decode(errors='replace').strip()
+        raise RuntimeError(f"ffmpeg exited with status {e.returncode}: {stderr}") from e
+    return result.stdout
+
+def _decode_enhanced_pcm(audio_path: str) -> bytes:
+    """Enhance a file and decode it to raw 16-bit mono PCM at SAMPLE_RATE"""
+    # Decode straight to stdout so nothing is re-encoded or written to disk
+    return _run_enhance_filtergraph(
+        audio_path,
+        ["-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"]
+    )
+
 @dataclass
 class SessionData:
     """Data structure for individual session information"""
@@ -35,6 +141,8 @@ class SessionData:
     confidence_level: float
     audio_quality: str
     emotional_state: str
+    # Per-transcript analysis, filled lazily by DeceptionAnalyzer.analyze_session
+    analysis: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
 
 class AudioProcessor:
     """Handles audio preprocessing and speech-to-text conversion"""
@@ -44,62 +152,65 @@ class AudioProcessor:
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = True
         self.recognizer.pause_threshold = 0.8
+        self.recognizer.operation_timeout = RECOGNIZER_TIMEOUT
         
     def enhance_audio(self, audio_path: str) -> str:
         """Enhance audio quality for better transcription"""
         try:
-            # Load audio file
-            audio = AudioSegment.from_file(audio_path)
-            
-            # Apply audio enhancements
-            # Normalize volume
-            audio = normalize(audio)
-            
-            # Reduce dynamic range to make quiet parts louder
-            audio = compress_dynamic_range(audio, threshold=-20.0, ratio=4.0)
-            
-            # Apply high-pass filter to reduce low-frequency noise
-            audio = audio.high_pass_filter(80)
-            
-            # Apply low-pass filter to reduce high-frequency noise
-            audio = audio.low_pass_filter(8000)
-            
-            # Export enhanced audio
-            # enhanced_path = audio_path.replace('.', '_enhanced.')
-            # audio.export(enhanced_path, format="wav")
             base, ext = os.path.splitext(audio_path)
             enhanced_path = base + "_enhanced.wav"
-            audio.export(enhanced_path, format="wav")
-            
+            _run_enhance_filtergraph(audio_path, ["-y", enhanced_path])
             return enhanced_path
             
         except Exception as e:
-            logger.error(f"Audio enhancement failed: {e}")
+            logger.error("Audio enhancement failed: %s", e)
             return audio_path
     
-    def transcribe_audio(self, audio_path: str) -> Tuple[str, float]:
-        """Convert audio to text with confidence scoring"""
+    def _calibrate_energy_threshold(self, pcm: bytes):
+        """Set the energy threshold from the RMS of the first second of 16-bit PCM"""
+        # Stands in for adjust_for_ambient_noise, which would make a separate
+        # pass over (and consume) the first second of the file
+        samples = np.frombuffer(pcm[:SAMPLE_RATE * SAMPLE_WIDTH], dtype=np.int16)
+        rms = float(np.sqrt(np.mean(samples.astype(np.float64) ** 2))) if samples.size else 0.0
+        
+        self.recognizer.energy_threshold = max(300, rms * 1.5)
+        self.recognizer.dynamic_energy_threshold = False
+    
+    def enhance_audio_data(self, audio_path: str) -> Optional[sr.AudioData]:
+        """Enhance audio and return it as in-memory PCM instead of a WAV file"""
         try:
-            # Enhance audio first
-            enhanced_path = self.enhance_audio(audio_path)
-            
-            # Load audio file
-            with sr.AudioFile(enhanced_path) as source:
-                # Adjust for ambient noise
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                audio_data = self.recognizer.record(source)
+            pcm = _decode_enhanced_pcm(audio_path)
+            self._calibrate_energy_threshold(pcm)
+            return sr.AudioData(pcm, SAMPLE_RATE, SAMPLE_WIDTH)
             
-            # Try multiple recognition engines for better accuracy
-            transcripts = []
-            confidences = []
+        except Exception as e:
+            logger.error("Audio enhancement failed: %s", e)
+            return None
+    
+    def _recognize(self, audio_data: sr.AudioData) -> Tuple[str, float, bool]:
+        """Run multiple recognition engines concurrently and keep the most confident result.
+        
+        Also returns whether the Google request succeeded; if not, the result
+        is at best the Sphinx fallback.
+        """
+        transcripts = []
+        confidences = []
+        google_ok = False
+        
+        # Google is network-bound and Sphinx is CPU-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            google_future = ex.submit(
+                self.recognizer.recognize_google,
+                audio_data,
+                show_all=True,
+                language='en-US'
+            )
+            sphinx_future = ex.submit(self.recognizer.recognize_sphinx, audio_data)
             
             # Google Speech Recognition
             try:
-                result = self.recognizer.recognize_google(
-                    audio_data, 
-                    show_all=True,
-                    language='en-US'
-                )
+                result = google_future.result()
+                google_ok = True
                 if result and 'alternative' in result:
                     for alt in result['alternative'][:3]:  # Top 3 alternatives
                         transcripts.append(alt.get('transcript', ''))
@@ -109,22 +220,210 @@ class AudioProcessor:
             
             # Sphinx (offline backup)
             try:
-                sphinx_result = self.recognizer.recognize_sphinx(audio_data)
+                sphinx_result = sphinx_future.result()
                 transcripts.append(sphinx_result)
                 confidences.append(0.3)  # Lower confidence for offline
             except:
                 pass
+        
+        # Select best transcript
+        if transcripts:
+            best_idx = confidences.index(max(confidences))
+            return transcripts[best_idx], confidences[best_idx], google_ok
+        else:
+            return "", 0.0, google_ok
+    
+    def _split_on_silence(self, audio_data: sr.AudioData) -> List[sr.AudioData]:
+        """Split audio into chunks of at most MAX_CHUNK_MS, cutting inside silences where possible"""
+        # Check the duration before copying the PCM into an AudioSegment
+        duration_ms = len(audio_data.frame_data) * 1000 // (audio_data.sample_rate * audio_data.sample_width)
+        if duration_ms <= MAX_CHUNK_MS:
+            return [audio_data]
+        
+        segment = AudioSegment(
+            data=audio_data.get_raw_data(convert_width=SAMPLE_WIDTH),
+            sample_width=SAMPLE_WIDTH,
+            frame_rate=audio_data.sample_rate,
+            channels=1
+        )
+        
+        # Voiced regions relative to the recording's own loudness
+        if np.isfinite(segment.dBFS):
+            voiced = detect_nonsilent(
+                segment,
+                min_silence_len=300,
+                silence_thresh=segment.dBFS - 16,
+                seek_step=10
+            )
+        else:
+            voiced = []
+        
+        cuts = [0]
+        last_end = 0
+        for start, end in voiced:
+            # Close the current chunk in the silence before this region
+            if end - cuts[-1] > MAX_CHUNK_MS and last_end > cuts[-1]:
+                cuts.append(min((last_end + start) // 2, cuts[-1] + MAX_CHUNK_MS))
+            # Voiced stretches longer than a chunk have no silence to cut at
+            while end - cuts[-1] > MAX_CHUNK_MS:
+                cuts.append(cuts[-1] + MAX_CHUNK_MS)
+            last_end = end
+        while len(segment) - cuts[-1] > MAX_CHUNK_MS:
+            cuts.append(cuts[-1] + MAX_CHUNK_MS)
+        cuts.append(len(segment))
+        
+        return [audio_data.get_segment(a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+    
+    def _recognize_chunked(self, audio_data: sr.AudioData) -> Tuple[str, float, bool]:
+        """Recognize long audio as silence-split chunks in parallel.
+        
+        Also returns whether Google succeeded on every chunk.
+        """
+        chunks = self._split_on_silence(audio_data)
+        if len(chunks) == 1:
+            return self._recognize(audio_data)
+        
+        with ThreadPoolExecutor(max_workers=min(len(chunks), CHUNK_WORKERS)) as ex:
+            results = list(ex.map(self._recognize, chunks))
+        
+        # Concatenate in order and weight each chunk's confidence by its duration
+        transcript = " ".join(text for text, _, _ in results if text)
+        durations = np.array([len(chunk.frame_data) for chunk in chunks], dtype=np.float64)
+        confidences = np.array([confidence for _, confidence, _ in results], dtype=np.float64)
+        google_ok = all(ok for _, _, ok in results)
+        
+        return transcript, float(np.average(confidences, weights=durations)), google_ok
+    
+    def transcribe_audio(self, audio_path: str) -> Tuple[str, float]:
+        """Convert audio to text with confidence scoring, reusing cached transcripts"""
+        try:
+            cache_path = _transcript_cache_path(audio_path)
+        except OSError:
+            cache_path = None
+        
+        if cache_path is not None:
+            cached = _load_cached_transcript(cache_path)
+            if cached is not None:
+                return cached
+        
+        transcript, confidence, cacheable = self._transcribe_uncached(audio_path)
+        
+        if cacheable and cache_path is not None:
+            _store_cached_transcript(cache_path, (transcript, confidence))
+        
+        return transcript, confidence
+    
+    def _transcribe_uncached(self, audio_path: str) -> Tuple[str, float, bool]:
+        """Transcribe a file, also returning whether the result may be cached.
+        
+        Only complete online results are cacheable: a Sphinx fallback or a
+        chunk lost to a passing Google failure would otherwise be served
+        forever instead of retrying.
+        """
+        try:
+            # Enhance audio first, keeping the PCM in memory
+            audio_data = self.enhance_audio_data(audio_path)
             
-            # Select best transcript
-            if transcripts:
-                best_idx = confidences.index(max(confidences))
-                return transcripts[best_idx], confidences[best_idx]
-            else:
-                return "", 0.0
+            if audio_data is None:
+                # Fall back to loading the original file
+                with sr.AudioFile(audio_path) as source:
+                    audio_data = self.recognizer.record(source)
                 
+                # Adjust for ambient noise
+                first_second = audio_data.get_segment(0, 1000)
+                self._calibrate_energy_threshold(
+                    first_second.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=SAMPLE_WIDTH)
+                )
+            
+            transcript, confidence, google_ok = self._recognize_chunked(audio_data)
+            return transcript, confidence, google_ok and bool(transcript)
+            
+        except Exception as e:
+            logger.error("Transcription failed: %s", e)
+            return "", 0.0, False
+
+def _transcribe_one(recognizer_settings: Dict[str, Any], audio_file: str) -> Tuple[str, float]:
+    """Transcribe a single session; top-level so it can be pickled into worker processes.
+    
+    Each call gets its own AudioProcessor, configured with the caller's
+    recognizer settings, since calibration mutates recognizer state.
+    """
+    processor = AudioProcessor()
+    vars(processor.recognizer).update(recognizer_settings)
+    return processor.transcribe_audio(audio_file)
+
+class WhisperBatcher:
+    """Transcribes all sessions locally with a batched faster-whisper model"""
+    
+    def __init__(self, model_size: str = "small.en", device: str = "auto", batch_size: int = 8,
+                 compute_type: Optional[str] = None):
+        # Optional dependency, only needed for the local Whisper backend
+        import ctranslate2
+        from faster_whisper import WhisperModel, BatchedInferencePipeline
+        
+        if device == "auto":
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        
+        # Int8 weights halve memory traffic versus fp16/fp32 with negligible
+        # accuracy loss; activations stay fp16 on GPU
+        if compute_type is None:
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        
+        model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self.pipeline = BatchedInferencePipeline(model=model)
+        self.batch_size = batch_size
+    
+    def _load_pcm(self, audio_path: str) -> Optional[np.ndarray]:
+        """Enhance a file and return it as float32 samples in [-1, 1]"""
+        try:
+            pcm = _decode_enhanced_pcm(audio_path)
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Audio enhancement failed: %s", e)
+            return None
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    
+    def _transcribe_pcm(self, samples: Optional[np.ndarray]) -> Tuple[str, float]:
+        """Transcribe one session's samples, batching its segments on the model's device"""
+        if samples is None or not samples.size:
+            return "", 0.0
+        
+        segments, _ = self.pipeline.transcribe(samples, language="en", batch_size=self.batch_size)
+        segments = list(segments)
+        if not segments:
             return "", 0.0
+        
+        transcript = " ".join(seg.text.strip() for seg in segments)
+        
+        # Confidence is the duration-weighted mean token probability
+        logprobs = np.array([seg.avg_logprob for seg in segments], dtype=np.float64)
+        durations = np.array([max(seg.end - seg.start, 1e-3) for seg in segments], dtype=np.float64)
+        confidence = float(np.exp(np.average(logprobs, weights=durations)))
+        
+        return transcript, confidence
+    
+    def transcribe_batch(self, audio_files: List[str]) -> List[Tuple[str, float]]:
+        """Transcribe all sessions, preserving input order"""
+        if not audio_files:
+            return []
+        
+        results = []
+        
+        # Decode lazily, prefetching the next session while the current one is
+        # transcribed, so at most two recordings are held in memory
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            pending = ex.submit(self._load_pcm, audio_files[0])
+            for idx, audio_path in enumerate(audio_files):
+                samples = pending.result()
+                if idx + 1 < len(audio_files):
+                    pending = ex.submit(self._load_pcm, audio_files[idx + 1])
+                
+                try:
+                    results.append(self._transcribe_pcm(samples))
+                except Exception as e:
+                    logger.error("Transcription failed for %s: %s", audio_path, e)
+                    results.append(("", 0.0))
+        
+        return results
 
 class DeceptionAnalyzer:
     """Analyzes transcripts for contradictions and deception patterns"""
@@ -132,9 +431,9 @@ class DeceptionAnalyzer:
     def __init__(self):
         # Key phrases and patterns for different categories
         self.experience_patterns = {
-            'years': r'(\d+)\s*(?:years?|yrs?)',
-            'months': r'(\d+)\s*(?:months?|mos?)',
-            'time_claims': r'(never|always|since|for|over|under|about|around|approximately)'
+            'years': re.compile(r'(\d+)\s*(?:years?|yrs?)'),
+            'months': re.compile(r'(\d+)\s*(?:months?|mos?)'),
+            'time_claims': re.compile(r'(never|always|since|for|over|under|about|around|approximately)')
         }
         
         self.skill_indicators = {
@@ -143,6 +442,7 @@ class DeceptionAnalyzer:
             'technologies': ['machine learning', 'ai', 'blockchain', 'cloud', 'docker', 'kubernetes'],
             'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch']
         }
+        self._langs = frozenset(self.skill_indicators['languages'])
         
         self.confidence_markers = {
             'high': ['definitely', 'absolutely', 'certainly', 'expert', 'master', 'proficient'],
@@ -155,50 +455,147 @@ class DeceptionAnalyzer:
             'backtracking': ['actually', 'correction', 'wait', 'no', 'i mean'],
             'emotional': ['crying', 'sobbing', 'shouting', 'whispering', 'nervous']
         }
+        
+        self.leadership_indicators = {
+            'claimed': ['lead', 'team lead', 'manager', 'lead developer'],
+            'denied': ['alone', 'individual', 'solo', 'by myself']
+        }
+        
+        self.team_indicators = {
+            'claimed': ['team', 'colleagues', 'group', 'collaborate'],
+            'denied': ['alone', 'individual', 'solo']
+        }
+        
+        # Emotional state cues, checked in priority order
+        self.emotional_states = {
+            'distressed': ['crying', 'sobbing', 'sob'],
+            'agitated': ['shouting', 'yelling', '!'],
+            'fearful': ['whisper', 'quiet', 'barely'],
+            'confident': ['confident', 'sure', 'absolutely']
+        }
+        
+        # One multi-pattern automaton over every keyword list, so each
+        # transcript is scanned once rather than once per keyword
+        self._automaton = self._build_automaton()
     
-    def extract_experience_claims(self, transcript: str) -> List[str]:
-        """Extract all experience-related claims from transcript"""
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton tagging each term with its (category, level) pairs"""
+        keyword_groups = {
+            'skill': self.skill_indicators,
+            'confidence': self.confidence_markers,
+            'deception': self.deception_indicators,
+            'emotion': self.emotional_states,
+            'leadership': self.leadership_indicators,
+            'team': self.team_indicators
+        }
+        
+        # A term may belong to several lists (e.g. 'absolutely')
+        tags = {}
+        for category, groups in keyword_groups.items():
+            for level, terms in groups.items():
+                for term in terms:
+                    tags.setdefault(term, []).append((category, level))
+        
+        automaton = ahocorasick.Automaton()
+        for term, term_tags in tags.items():
+            automaton.add_word(term, (term, tuple(term_tags)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan(self, text: str) -> Counter:
+        """Count keyword occurrences in lowercased text, keyed by (category, level, term)"""
+        counts = Counter()
+        for _, (term, term_tags) in self._automaton.iter(text):
+            for category, level in term_tags:
+                counts[(category, level, term)] += 1
+        return counts
+    
+    def _experience_from(self, text: str) -> List[str]:
+        """Extract year/month claims from lowercased text"""
         claims = []
-        text = transcript.lower()
         
-        # Find year/month claims
         for pattern_type, pattern in self.experience_patterns.items():
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             for match in matches:
                 if pattern_type in ['years', 'months']:
                     claims.append(f"{match} {pattern_type}")
         
         return claims
     
-    def extract_skills(self, transcript: str) -> List[str]:
-        """Extract mentioned skills and technologies"""
-        skills = []
-        text = transcript.lower()
-        
-        for category, skill_list in self.skill_indicators.items():
-            for skill in skill_list:
-                if skill in text:
-                    skills.append(skill)
-        
-        return list(set(skills))  # Remove duplicates
+    def _skills_from(self, counts: Counter) -> List[str]:
+        """Collect skills from keyword counts"""
+        # Counter keys are unique, so no duplicates
+        return [term for category, _, term in counts if category == 'skill']
     
-    def assess_confidence_level(self, transcript: str) -> str:
-        """Assess speaker's confidence level based on language markers"""
-        text = transcript.lower()
+    def _confidence_from(self, counts: Counter) -> str:
+        """Score confidence levels from keyword counts"""
         confidence_scores = {'high': 0, 'medium': 0, 'low': 0}
         
-        for level, markers in self.confidence_markers.items():
-            for marker in markers:
-                confidence_scores[level] += text.count(marker)
-        
-        # Also check for deception indicators (reduce confidence)
-        for category, indicators in self.deception_indicators.items():
-            for indicator in indicators:
-                confidence_scores['low'] += text.count(indicator)
+        for (category, level, _), count in counts.items():
+            if category == 'confidence':
+                confidence_scores[level] += count
+            elif category == 'deception':
+                # Deception indicators reduce confidence
+                confidence_scores['low'] += count
         
         # Return the confidence level with highest score
         return max(confidence_scores.items(), key=lambda x: x[1])[0]
     
+    def _emotion_from(self, counts: Counter) -> str:
+        """Pick the highest-priority emotional state present in keyword counts"""
+        found = {level for category, level, _ in counts if category == 'emotion'}
+        
+        for state in self.emotional_states:
+            if state in found:
+                return state
+        return "neutral"
+    
+    def _claim_from(self, counts: Counter, category: str) -> Optional[bool]:
+        """Return True if a claim is made, False if it is denied, None if not mentioned"""
+        found = {level for cat, level, _ in counts if cat == category}
+        
+        if 'claimed' in found:
+            return True
+        elif 'denied' in found:
+            return False
+        return None
+    
+    def analyze(self, transcript: str) -> Dict[str, Any]:
+        """Run every per-transcript analysis from a single lowercase copy and keyword scan"""
+        text = transcript.lower()
+        counts = self._scan(text)
+        
+        return {
+            'skills': self._skills_from(counts),
+            'experience': self._experience_from(text),
+            'confidence': self._confidence_from(counts),
+            'emotion': self._emotion_from(counts),
+            'leadership': self._claim_from(counts, 'leadership'),
+            'team': self._claim_from(counts, 'team')
+        }
+    
+    def analyze_session(self, session: SessionData) -> Dict[str, Any]:
+        """Analyze a session once and cache the result on the session"""
+        if session.analysis is None:
+            session.analysis = self.analyze(session.transcript)
+        return session.analysis
+    
+    def extract_experience_claims(self, transcript: str) -> List[str]:
+        """Extract all experience-related claims from transcript"""
+        return self._experience_from(transcript.lower())
+    
+    def extract_skills(self, transcript: str) -> List[str]:
+        """Extract mentioned skills and technologies"""
+        return self._skills_from(self._scan(transcript.lower()))
+    
+    def assess_confidence_level(self, transcript: str) -> str:
+        """Assess speaker's confidence level based on language markers"""
+        return self._confidence_from(self._scan(transcript.lower()))
+    
+    def detect_emotional_state(self, transcript: str) -> str:
+        """Detect emotional state from transcript content"""
+        return self._emotion_from(self._scan(transcript.lower()))
+    
     def find_contradictions(self, sessions: List[SessionData]) -> List[Dict]:
         """Find contradictions across all sessions"""
         contradictions = []
@@ -206,34 +603,33 @@ class DeceptionAnalyzer:
         # Extract claims from all sessions
         all_claims = {}
         for session in sessions:
-            session_claims = {
-                'experience': self.extract_experience_claims(session.transcript),
-                'skills': self.extract_skills(session.transcript),
-                'confidence': self.assess_confidence_level(session.transcript)
-            }
-            all_claims[f"session_{session.session_id}"] = session_claims
+            all_claims[f"session_{session.session_id}"] = self.analyze_session(session)
         
         # Compare experience claims
         experience_claims = []
         for session_id, claims in all_claims.items():
             experience_claims.extend(claims['experience'])
         
-        if len(set(experience_claims)) > 1:
+        # Deduplicate in order of first claim so the report is stable across runs
+        unique_claims = list(dict.fromkeys(experience_claims))
+        if len(unique_claims) > 1:
             contradictions.append({
                 'lie_type': 'experience_inflation',
-                'contradictory_claims': list(set(experience_claims))
+                'contradictory_claims': unique_claims
             })
         
-        # Compare skill claims
-        skill_consistency = []
-        for session_id, claims in all_claims.items():
-            if claims['skills']:
-                skill_consistency.append(len(claims['skills']))
+        # Compare skill claims across sessions that mention any skills
+        skill_counts = np.fromiter(
+            (len(claims['skills']) for claims in all_claims.values()),
+            dtype=np.int32,
+            count=len(all_claims)
+        )
+        skill_counts = skill_counts[skill_counts > 0]
         
-        if skill_consistency and max(skill_consistency) - min(skill_consistency) > 3:
+        if skill_counts.size and np.ptp(skill_counts) > 3:
             contradictions.append({
                 'lie_type': 'skill_exaggeration',
-                'contradictory_claims': [f"claimed {min(skill_consistency)} to {max(skill_consistency)} skills"]
+                'contradictory_claims': [f"claimed {skill_counts.min()} to {skill_counts.max()} skills"]
             })
         
         return contradictions
@@ -241,21 +637,56 @@ class DeceptionAnalyzer:
 class TruthWeaver:
     """Main class that orchestrates the entire truth detection process"""
     
-    def __init__(self):
+    def __init__(self, use_processes: bool = True, asr_backend: str = "google",
+                 whisper_options: Optional[Dict[str, Any]] = None):
         self.audio_processor = AudioProcessor()
         self.deception_analyzer = DeceptionAnalyzer()
+        # Processes suit the CPU-bound decode/Sphinx path; threads are enough
+        # when the network-bound Google recognizer dominates
+        self.use_processes = use_processes
+        
+        # "google" uses the online/Sphinx recognizers per session; "whisper"
+        # runs every session through one local faster-whisper model, built
+        # with whisper_options (model_size, device, batch_size, compute_type)
+        if asr_backend == "whisper":
+            self.whisper = WhisperBatcher(**(whisper_options or {}))
+        elif asr_backend == "google":
+            if whisper_options:
+                raise ValueError("whisper_options requires asr_backend=\"whisper\"")
+            self.whisper = None
+        else:
+            raise ValueError(f"Unknown ASR backend: {asr_backend}")
+    
+    def _transcribe_sessions(self, audio_files: List[str]) -> List[Tuple[str, float]]:
+        """Transcribe all sessions concurrently, preserving input order"""
+        if not audio_files:
+            return []
+        
+        if self.whisper is not None:
+            return self.whisper.transcribe_batch(audio_files)
+        
+        if self.use_processes:
+            executor_cls = ProcessPoolExecutor
+            max_workers = min(len(audio_files), os.cpu_count() or 1)
+        else:
+            executor_cls = ThreadPoolExecutor
+            max_workers = len(audio_files)
+        
+        with executor_cls(max_workers=max_workers) as ex:
+            transcribe = functools.partial(_transcribe_one, dict(vars(self.audio_processor.recognizer)))
+            return list(ex.map(transcribe, audio_files))
     
     def process_shadow_case(self, audio_files: List[str], shadow_id: str) -> Dict:
         """Process all audio files for a shadow agent and extract truth"""
         sessions = []
-        combined_transcript = ""
+        transcript_parts = []
         
-        # Process each audio file
-        for i, audio_file in enumerate(audio_files, 1):
-            logger.info(f"Processing session {i}: {audio_file}")
-            
-            # Transcribe audio
-            transcript, confidence = self.audio_processor.transcribe_audio(audio_file)
+        # Transcribe all audio files in parallel
+        results = self._transcribe_sessions(audio_files)
+        
+        # Process each transcribed session
+        for i, (audio_file, (transcript, confidence)) in enumerate(zip(audio_files, results), 1):
+            logger.debug("Processing session %d: %s", i, audio_file)
             
             if transcript:
                 # Determine audio quality based on confidence
@@ -266,20 +697,23 @@ class TruthWeaver:
                 else:
                     quality = "poor"
                 
-                # Determine emotional state
-                emotional_state = self._detect_emotional_state(transcript)
+                # Analyze the transcript once; emotional state comes from the same pass
+                analysis = self.deception_analyzer.analyze(transcript)
                 
                 session = SessionData(
                     session_id=i,
                     transcript=transcript,
                     confidence_level=confidence,
                     audio_quality=quality,
-                    emotional_state=emotional_state
+                    emotional_state=analysis['emotion']
                 )
+                session.analysis = analysis
                 sessions.append(session)
                 
                 # Add to combined transcript
-                combined_transcript += f"Session {i}:\n{transcript}\n\n"
+                transcript_parts.append(f"Session {i}:\n{transcript}\n\n")
+        
+        combined_transcript = "".join(transcript_parts)
         
         # Analyze for contradictions and truth
         contradictions = self.deception_analyzer.find_contradictions(sessions)
@@ -294,93 +728,79 @@ class TruthWeaver:
         
         return result, combined_transcript
     
-    def _detect_emotional_state(self, transcript: str) -> str:
-        """Detect emotional state from transcript content"""
-        text = transcript.lower()
-        
-        if any(word in text for word in ['crying', 'sobbing', 'sob']):
-            return "distressed"
-        elif any(word in text for word in ['shouting', 'yelling', '!']):
-            return "agitated"
-        elif any(word in text for word in ['whisper', 'quiet', 'barely']):
-            return "fearful"
-        elif any(word in text for word in ['confident', 'sure', 'absolutely']):
-            return "confident"
-        else:
-            return "neutral"
-    
     def _extract_truth(self, sessions: List[SessionData]) -> Dict:
         """Extract the most likely truth from all sessions"""
         # Aggregate all information
-        all_skills = []
+        skill_counter = Counter()
+        lang_counter = Counter()
         all_experience_claims = []
-        programming_languages = set()
-        leadership_mentions = []
-        team_mentions = []
-        
-        for session in sessions:
-            skills = self.deception_analyzer.extract_skills(session.transcript)
-            all_skills.extend(skills)
+        languages = self.deception_analyzer._langs
+        
+        # Per-session fields as parallel arrays; leadership/team use
+        # 1 = claimed, 0 = denied, -1 = not mentioned
+        leadership = np.full(len(sessions), -1, dtype=np.int8)
+        team = np.full(len(sessions), -1, dtype=np.int8)
+        confidence_ranks = np.zeros(len(sessions), dtype=np.int8)
+        
+        for idx, session in enumerate(sessions):
+            analysis = self.deception_analyzer.analyze_session(session)
+            skills = analysis['skills']
+            skill_counter.update(skills)
             
-            experience = self.deception_analyzer.extract_experience_claims(session.transcript)
-            all_experience_claims.extend(experience)
+            all_experience_claims.extend(analysis['experience'])
             
-            # Check for programming languages
-            text = session.transcript.lower()
-            for lang in self.deception_analyzer.skill_indicators['languages']:
-                if lang in text:
-                    programming_languages.add(lang)
+            # Count programming languages by number of sessions mentioning them;
+            # keyword hits have no word boundaries, so raw hit counts would
+            # favour short names like 'go' (matched by 'good', 'ago', ...)
+            lang_counter.update(s for s in skills if s in languages)
             
             # Check for leadership claims
-            if any(word in text for word in ['lead', 'team lead', 'manager', 'lead developer']):
-                leadership_mentions.append(True)
-            elif any(word in text for word in ['alone', 'individual', 'solo', 'by myself']):
-                leadership_mentions.append(False)
+            if analysis['leadership'] is not None:
+                leadership[idx] = analysis['leadership']
             
             # Check for team experience
-            if any(word in text for word in ['team', 'colleagues', 'group', 'collaborate']):
-                team_mentions.append(True)
-            elif any(word in text for word in ['alone', 'individual', 'solo']):
-                team_mentions.append(False)
+            if analysis['team'] is not None:
+                team[idx] = analysis['team']
+            
+            confidence_ranks[idx] = CONFIDENCE_RANKS[analysis['confidence']]
         
         # Determine most likely truth
         truth = {}
         
         # Programming experience (look for lowest claim in later sessions)
         if all_experience_claims:
-            # Extract numeric values and find the most conservative estimate
-            numeric_claims = []
-            for claim in all_experience_claims:
-                numbers = re.findall(r'\d+', claim)
-                if numbers:
-                    numeric_claims.append(int(numbers[0]))
+            # Extract numeric values into a typed buffer and find the most
+            # conservative estimate with a single native reduction
+            matches = (_NUM_RE.search(claim) for claim in all_experience_claims)
+            numeric_claims = np.array([int(m.group()) for m in matches if m], dtype=np.int64)
             
-            if numeric_claims:
+            if numeric_claims.size:
                 # Truth is likely closer to lower estimates (less inflated)
-                truth["programming_experience"] = f"{min(numeric_claims)}-{max(numeric_claims)} years"
+                truth["programming_experience"] = f"{numeric_claims.min()}-{numeric_claims.max()} years"
             else:
                 truth["programming_experience"] = "unspecified"
         else:
             truth["programming_experience"] = "unspecified"
         
         # Primary programming language
-        if programming_languages:
-            truth["programming_language"] = list(programming_languages)[0]  # Most mentioned
+        if lang_counter:
+            # Most mentioned; ties go to the language seen in the earliest session
+            truth["programming_language"] = lang_counter.most_common(1)[0][0]
         else:
             truth["programming_language"] = "unspecified"
         
         # Skill mastery level
-        confidence_levels = [self.deception_analyzer.assess_confidence_level(s.transcript) for s in sessions]
-        if 'high' in confidence_levels:
+        top_confidence = confidence_ranks.max(initial=CONFIDENCE_RANKS['low'])
+        if top_confidence == CONFIDENCE_RANKS['high']:
             truth["skill_mastery"] = "intermediate"  # Conservative estimate
-        elif 'medium' in confidence_levels:
+        elif top_confidence == CONFIDENCE_RANKS['medium']:
             truth["skill_mastery"] = "beginner-intermediate"
         else:
             truth["skill_mastery"] = "beginner"
         
         # Leadership claims
-        if any(leadership_mentions):
-            if any(not x for x in leadership_mentions):  # Mixed claims
+        if (leadership == 1).any():
+            if (leadership == 0).any():  # Mixed claims
                 truth["leadership_claims"] = "fabricated"
             else:
                 truth["leadership_claims"] = "claimed"
@@ -388,17 +808,16 @@ class TruthWeaver:
             truth["leadership_claims"] = "no claims made"
         
         # Team experience
-        if any(team_mentions):
-            if any(not x for x in team_mentions):  # Mixed claims
+        if (team == 1).any():
+            if (team == 0).any():  # Mixed claims
                 truth["team_experience"] = "individual contributor"
             else:
                 truth["team_experience"] = "team member"
         else:
             truth["team_experience"] = "individual contributor"
         
-        # Skills and keywords
-        unique_skills = list(set(all_skills))
-        truth["skills and other keywords"] = unique_skills
+        # Skills and keywords, most frequently mentioned first
+        truth["skills and other keywords"] = [skill for skill, _ in skill_counter.most_common()]
         
         return truth
     
@@ -408,15 +827,14 @@ class TruthWeaver:
         
         # Save JSON result
         json_path = os.path.join(output_dir, f"{result['shadow_id']}_analysis.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
+        Path(json_path).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         
         # Save transcript
         txt_path = os.path.join(output_dir, f"{result['shadow_id']}_transcript.txt")
         with open(txt_path, 'w', encoding='utf-8') as f:
             f.write(transcript)
         
-        logger.info(f"Results saved to {output_dir}")
+        logger.info("Results saved to %s", output_dir)
 
 def main():
     """Main execution function for processing shadow cases"""
@@ -447,12 +865,14 @@ def main():
         print(json.dumps(result, indent=2))
         
     except Exception as e:
-        logger.error(f"Processing failed: {e}")
+        logger.error("Processing failed: %s", e)
         return False
     
     return True
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
     success = main()
     if success:
         print("\n✅ Truth Weaver completed successfully!")